@@ -2,26 +2,33 @@
 # /// script
 # requires-python = ">=3.14"
 # dependencies = [
+#     "httpx[http2]",
 #     "icalevents",
-#     "flask",
+#     "orjson",
 #     "pyobjc",
+#     "quart",
+#     "uvicorn[standard]",
 # ]
 # ///
 
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-import os
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+import hashlib
+import html
 from pathlib import Path
 import re
 import socket
-import subprocess
 import threading
 import time
 from urllib.parse import parse_qs, unquote, urlencode, urlparse
 from zoneinfo import ZoneInfo
 
+import httpx
 import objc
-from flask import Flask, jsonify, render_template_string, request
+import orjson
+from quart import Quart, Response, jsonify, make_response, request
+import uvicorn
 from AppKit import (
     NSApplication,
     NSApplicationActivationPolicyRegular,
@@ -34,19 +41,42 @@ from AppKit import (
     NSWindow,
     NSWindowStyleMaskClosable,
     NSWindowStyleMaskTitled,
+    NSWorkspace,
 )
-from Foundation import NSMakeRect, NSObject, NSURL, NSURLRequest
+from Foundation import NSMakeRect, NSObject, NSOperationQueue, NSURL, NSURLRequest
 from WebKit import WKWebView, WKWebViewConfiguration
 from icalevents.icalevents import events as ical_events
 
 LOCAL_TZ = datetime.now().astimezone().tzinfo or ZoneInfo("UTC")
+# LOCAL_TZ is a fixed-offset zone, so its offset is the same for every date.
+LOCAL_UTCOFFSET = LOCAL_TZ.utcoffset(None)
+# Punctuation that ends a sentence rather than the URL it follows.
+URL_TRAILING_CHARS = ").,;"
 ZOOM_URL_RE = re.compile(
     r"(https?://[^\s<>\"]+|(?:[a-z0-9.-]+\.)?zoom\.us/[^\s<>\"]+)",
     re.IGNORECASE,
 )
+# Every character str.isspace() (and the regex \s) accepts.
+WHITESPACE_CHARS = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004"
+    "\u2005\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+URL_DELIMITERS = frozenset(WHITESPACE_CHARS + '<>"\0')
+HOST_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789.-")
 HOST = "127.0.0.1"
 DEFAULT_SOURCE_FILE_LABEL = "~/.dash-to-meeting"
 DEFAULT_SOURCE_FILE = Path("~/.dash-to-meeting").expanduser()
+HTTP_CLIENT = httpx.AsyncClient(http2=True, follow_redirects=True, timeout=15.0)
+EVENT_WINDOW = timedelta(days=7)
+# The page clamps descriptions to five lines of a narrow window, so longer
+# text is never visible; cut it before it goes into every payload.
+DESCRIPTION_MAX_CHARS = 330
+# Parsed events are reused for a while; parsing with a day of slack on both
+# sides of the visible window keeps them valid until the next reparse.
+PARSE_SLACK = timedelta(days=1)
+REPARSE_AFTER = timedelta(hours=6)
+CACHE_MIN_TTL_SECONDS = 30.0
+REFRESH_INTERVAL_SECONDS = 5 * 60.0
 
 
 @dataclass(slots=True)
@@ -57,18 +87,31 @@ class DisplayEvent:
     start: datetime
     end: datetime
     zoom_link: str | None
+    start_iso: str = field(init=False)
+    end_iso: str = field(init=False)
+    json_bytes: bytes = field(init=False)
+
+    def __post_init__(self):
+        # Events are built once per parse and served many times, so render up front.
+        self.start_iso = self.start.isoformat()
+        self.end_iso = self.end.isoformat()
+        self.json_bytes = orjson.dumps(self.as_json())
 
     def as_json(self) -> dict[str, str | None]:
         return {
             "id": self.id,
             "title": self.title,
             "description": self.description,
-            "start_iso": self.start.isoformat(),
-            "end_iso": self.end.isoformat(),
+            "start_iso": self.start_iso,
+            "end_iso": self.end_iso,
             "zoom_link": self.zoom_link,
         }
 
 
+def events_json(events: list[DisplayEvent]) -> bytes:
+    return b"[" + b",".join(event.json_bytes for event in events) + b"]"
+
+
 def normalize_text(text: str | None, fallback: str) -> str:
     if not text:
         return fallback
@@ -80,27 +123,54 @@ def to_local(dt: datetime | None, default: datetime) -> datetime:
         return default
     if dt.tzinfo is None:
         return dt.replace(tzinfo=LOCAL_TZ)
+    if dt.tzinfo is LOCAL_TZ:
+        return dt
+    # A datetime already at the local offset only needs relabelling, not a
+    # conversion.
+    if dt.utcoffset() == LOCAL_UTCOFFSET:
+        return dt.replace(tzinfo=LOCAL_TZ)
     return dt.astimezone(LOCAL_TZ)
 
 
 def canonicalize_zoom_url(candidate: str) -> str | None:
-    cleaned = candidate.strip().rstrip(").,;")
+    cleaned = candidate.strip().rstrip(URL_TRAILING_CHARS)
     if not cleaned:
         return None
-    if "://" not in cleaned:
+    if cleaned.startswith("//"):
+        cleaned = f"https:{cleaned}"
+    elif "://" not in cleaned:
         cleaned = f"https://{cleaned}"
-    parsed = urlparse(cleaned)
-    if parsed.scheme not in {"http", "https"}:
+
+    # Find the scheme and host with plain string scans; urlparse is only
+    # needed for bracketed IPv6 hosts.
+    scheme_end = cleaned.find("://")
+    if cleaned[:scheme_end].lower() not in {"http", "https"}:
         return None
-    host = (parsed.hostname or "").lower()
-    if not host.endswith("zoom.us"):
+    host_start = scheme_end + 3
+    host_end = len(cleaned)
+    for delimiter in "/?#":
+        index = cleaned.find(delimiter, host_start, host_end)
+        if index != -1:
+            host_end = index
+    host = cleaned[host_start:host_end]
+    if "[" in host or "]" in host:
+        # Bracketed hosts need urlparse; it raises on unbalanced brackets.
+        try:
+            host = urlparse(cleaned).hostname or ""
+        except ValueError:
+            return None
+    else:
+        host = host[host.rfind("@") + 1 :].partition(":")[0]
+    # Only the suffix matters, so only the suffix is lowercased.
+    if host[-len("zoom.us") :].lower() != "zoom.us":
         return None
     return cleaned
 
 
 def to_zoom_native_url(zoom_url: str) -> str | None:
     parsed = urlparse(zoom_url)
-    host = (parsed.hostname or "").lower()
+    # urlparse already lowercases hostname.
+    host = parsed.hostname or ""
     if not host.endswith("zoom.us"):
         return None
 
@@ -129,8 +199,75 @@ def extract_zoom_link(
     title: str | None,
     description: str | None,
 ) -> str | None:
-    # Location has precedence over title/description.
+    # Calendar-generated meetings usually carry just the join URL as the
+    # location; take it directly when it is one clean https link.
+    if location:
+        candidate = location.strip()
+        if (
+            candidate.startswith("https://")
+            and "zoom.us/" in candidate
+            and URL_DELIMITERS.isdisjoint(candidate)
+        ):
+            zoom_url = canonicalize_zoom_url(candidate)
+            if zoom_url:
+                return zoom_url
+
+    # Location has precedence over title/description: scanning the joined
+    # fields front to back checks them in that order.
+    text = "\0".join((location or "", title or "", description or ""))
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # Lowercasing shifted offsets (rare non-ASCII case mappings).
+        return extract_zoom_link_re(location, title, description)
+
+    end_of_text = len(text)
+    hit = lowered.find("zoom.us")
+    while hit != -1:
+        start = hit
+        while start > 0 and lowered[start - 1] not in URL_DELIMITERS:
+            start -= 1
+        end = hit + len("zoom.us")
+        while end < end_of_text and lowered[end] not in URL_DELIMITERS:
+            end += 1
+
+        # Like the old leftmost regex match, the URL runs from the first
+        # http(s):// or bare Zoom host in the token to the end of the token.
+        url_start = end
+        for scheme in ("http://", "https://"):
+            index = lowered.find(scheme, start, end)
+            if index != -1 and index + len(scheme) < end:
+                url_start = min(url_start, index)
+        host_hit = lowered.find("zoom.us/", start, end)
+        if host_hit != -1 and host_hit + len("zoom.us/") < end:
+            host_start = host_hit
+            if host_hit - 1 > start and lowered[host_hit - 1] == ".":
+                host_start = host_hit - 1
+                while host_start > start and lowered[host_start - 1] in HOST_CHARS:
+                    host_start -= 1
+                if host_start == host_hit - 1:
+                    host_start = host_hit
+            url_start = min(url_start, host_start)
+
+        # A token whose URL isn't a Zoom link is skipped whole, so links
+        # nested inside other URLs (redirects) aren't picked apart.
+        if url_start < end:
+            zoom_url = canonicalize_zoom_url(text[url_start:end])
+            if zoom_url:
+                return zoom_url
+        hit = lowered.find("zoom.us", end)
+    return None
+
+
+def extract_zoom_link_re(
+    location: str | None,
+    title: str | None,
+    description: str | None,
+) -> str | None:
     for text in (location or "", title or "", description or ""):
+        if "zoom.us" not in text.lower():
+            continue
+        # Same host rules as the scanner: every match goes through
+        # canonicalize_zoom_url.
         for match in ZOOM_URL_RE.findall(text):
             zoom_url = canonicalize_zoom_url(match)
             if zoom_url:
@@ -138,31 +275,185 @@ def extract_zoom_link(
     return None
 
 
-def load_events(source: str):
-    parsed = urlparse(source)
-    if parsed.scheme in {"http", "https", "webcal"}:
-        return ical_events(source, sort=True, fix_apple=True)
+@dataclass(slots=True)
+class CacheEntry:
+    etag: str | None
+    last_modified: str | None
+    # Remote ICS text, kept for reparsing after a 304. Local files are
+    # cheap to read again, so they aren't held in memory.
+    content: str | None
+    # Shared by every refresh until the next reparse, so kept immutable.
+    events: tuple[DisplayEvent, ...]
+    parsed_at: datetime
+    fetched_at: float
+
+
+ICS_CACHE: dict[str, CacheEntry] = {}
+ICS_CACHE_LOCK = asyncio.Lock()
+
+
+def ics_date_prefix(line: str) -> str | None:
+    # "DTSTART;TZID=Europe/Paris:20250101T090000" -> "20250101"
+    value = line[line.rfind(":") + 1 :]
+    day = value[:8]
+    return day if len(day) == 8 and day.isdigit() else None
+
+
+def prune_ics(content: str, first_day: str, last_day: str) -> str:
+    # Drop one-off VEVENTs that end before first_day or start after last_day
+    # (both YYYYMMDD) so icalevents doesn't parse years of history. Anything
+    # recurring, overriding a recurrence, or not plainly dated is kept.
+    kept: list[str] = []
+    event: list[str] | None = None
+    depth = 0
+    keep = False
+    start_day = end_day = None
+
+    for line in content.splitlines(keepends=True):
+        if event is None:
+            if line.startswith("BEGIN:VEVENT"):
+                event = [line]
+                depth = 0
+                keep = False
+                start_day = end_day = None
+            else:
+                kept.append(line)
+            continue
+
+        event.append(line)
+        if line.startswith("BEGIN:"):
+            depth += 1
+        elif line.startswith("END:"):
+            if depth:
+                depth -= 1
+                continue
+            if keep or start_day is None:
+                kept.extend(event)
+            elif (end_day or start_day) >= first_day and start_day <= last_day:
+                kept.extend(event)
+            event = None
+        elif depth == 0:
+            name = line.partition(":")[0].partition(";")[0]
+            if name in {"RRULE", "RDATE", "RECURRENCE-ID", "DURATION"}:
+                keep = True
+            elif name == "DTSTART":
+                start_day = ics_date_prefix(line.rstrip("\r\n"))
+            elif name == "DTEND":
+                end_day = ics_date_prefix(line.rstrip("\r\n"))
+
+    if event is not None:
+        kept.extend(event)
+    return "".join(kept)
+
+
+def parse_ics(content: str, now: datetime) -> tuple[DisplayEvent, ...]:
+    utc_now = now.astimezone(timezone.utc)
+    window_start = utc_now - PARSE_SLACK
+    window_end = utc_now + EVENT_WINDOW + PARSE_SLACK
+    # Event dates are wall-clock times in arbitrary zones; pad a day for offsets.
+    content = prune_ics(
+        content,
+        (window_start - timedelta(days=1)).strftime("%Y%m%d"),
+        (window_end + timedelta(days=1)).strftime("%Y%m%d"),
+    )
+    raw_events = ical_events(
+        None,
+        string_content=content,
+        start=window_start,
+        end=window_end,
+        sort=True,
+        fix_apple=True,
+    )
+    now_ts = int(now.timestamp())
+    return tuple(to_display_event(event, now, now_ts, i) for i, event in enumerate(raw_events))
 
+
+def local_ics_path(source: str) -> Path | None:
+    parsed = urlparse(source)
     if parsed.scheme == "file":
         local_path = Path(unquote(parsed.path))
         if local_path.exists():
-            return ical_events(
-                None,
-                string_content=local_path.read_text(encoding="utf-8"),
-                sort=True,
-                fix_apple=True,
-            )
+            return local_path
 
     local_path = Path(source).expanduser()
     if local_path.exists():
-        return ical_events(
-            None,
-            string_content=local_path.read_text(encoding="utf-8"),
-            sort=True,
-            fix_apple=True,
-        )
+        return local_path
+    return None
+
+
+def file_validator(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_mtime_ns}-{stat.st_size}"
+
+
+async def fetch_ics(url: str, cached: CacheEntry | None) -> httpx.Response:
+    # Map webcal:// to http:// like icalevents does; servers that want
+    # https redirect there, and redirects are followed.
+    if url.startswith("webcal://"):
+        url = "http://" + url.removeprefix("webcal://")
+
+    headers = {}
+    if cached is not None:
+        if cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
+
+    response = await HTTP_CLIENT.get(url, headers=headers)
+    if response.status_code != 304:
+        response.raise_for_status()
+    return response
+
+
+async def revalidate(source: str, cached: CacheEntry | None, now: datetime) -> CacheEntry:
+    if urlparse(source).scheme in {"http", "https", "webcal"}:
+        response = await fetch_ics(source, cached)
+        if response.status_code == 304 and cached is not None:
+            cached.fetched_at = time.monotonic()
+            return cached
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        content = response.text
+        retained = content
+    else:
+        local_path = local_ics_path(source)
+        if local_path is None:
+            raise FileNotFoundError(f"Calendar source not found: {source}")
+        # Local files are validated by modification time and size.
+        etag = file_validator(local_path)
+        last_modified = None
+        if cached is not None and cached.etag == etag:
+            cached.fetched_at = time.monotonic()
+            return cached
+        content = await asyncio.to_thread(local_path.read_text, encoding="utf-8")
+        retained = None
+
+    # Parsing and recurrence expansion are CPU-bound; keep them off the event loop.
+    events = await asyncio.to_thread(parse_ics, content, now)
+    return CacheEntry(
+        etag=etag,
+        last_modified=last_modified,
+        content=retained,
+        events=events,
+        parsed_at=now,
+        fetched_at=time.monotonic(),
+    )
+
 
-    return ical_events(source, sort=True, fix_apple=True)
+async def load_events(source: str, now: datetime) -> tuple[DisplayEvent, ...]:
+    # One lock for all sources: concurrent refreshes wait for a single fetch.
+    async with ICS_CACHE_LOCK:
+        entry = ICS_CACHE.get(source)
+        if entry is not None and entry.content is None and now - entry.parsed_at >= REPARSE_AFTER:
+            # Reparsing a local file means reading it again.
+            entry = None
+        if entry is None or time.monotonic() - entry.fetched_at >= CACHE_MIN_TTL_SECONDS:
+            entry = await revalidate(source, entry, now)
+            ICS_CACHE[source] = entry
+        if now - entry.parsed_at >= REPARSE_AFTER:
+            entry.events = await asyncio.to_thread(parse_ics, entry.content, now)
+            entry.parsed_at = now
+        return entry.events
 
 
 def load_default_source() -> tuple[str | None, str | None]:
@@ -182,17 +473,30 @@ def load_default_source() -> tuple[str | None, str | None]:
     return None, f"Source file is empty: {DEFAULT_SOURCE_FILE}"
 
 
-def to_display_event(event, now: datetime, index: int) -> DisplayEvent:
-    start = to_local(event.start, now)
+def to_display_event(
+    event,
+    now: datetime,
+    now_ts: int,
+    index: int,
+) -> DisplayEvent:
+    raw_start = event.start
+    summary = event.summary
+    description = event.description
+
+    start = to_local(raw_start, now)
     end_guess = start + timedelta(minutes=30)
     end = to_local(event.end, end_guess)
     if end <= start:
         end = end_guess
 
-    title = normalize_text(event.summary, "No title")
-    description = normalize_text(event.description, "")
-    zoom_link = extract_zoom_link(event.location, event.summary, event.description)
-    event_id = f"{int(start.timestamp())}-{index}"
+    title = normalize_text(summary, "No title")
+    zoom_link = extract_zoom_link(event.location, summary, description)
+    description = normalize_text(description, "")
+    if len(description) > DESCRIPTION_MAX_CHARS:
+        description = f"{description[: DESCRIPTION_MAX_CHARS - 3]}..."
+    # Events without a start fall back to now, whose timestamp is known.
+    start_ts = now_ts if raw_start is None else int(start.timestamp())
+    event_id = f"{start_ts}-{index}"
 
     return DisplayEvent(
         id=event_id,
@@ -208,23 +512,78 @@ class EventProvider:
     def __init__(self, source: str | None, startup_error: str | None = None):
         self.source = source
         self.startup_error = startup_error
+        self._local_tz = LOCAL_TZ
 
-    def get_events(self) -> list[DisplayEvent]:
+    async def get_events(self) -> list[DisplayEvent]:
         if self.startup_error:
             raise RuntimeError(self.startup_error)
         if not self.source:
             raise RuntimeError("No event source configured.")
-        now = datetime.now(tz=LOCAL_TZ)
-        raw_events = load_events(self.source)
-        return [to_display_event(event, now, i) for i, event in enumerate(raw_events)]
+        now = datetime.now(tz=self._local_tz)
+        window_end = now + EVENT_WINDOW
+        events = await load_events(self.source, now)
+        return [event for event in events if event.end >= now and event.start <= window_end]
+
+
+class EventFeed:
+    # A single background task refreshes the events and every client reads
+    # or subscribes to the latest payload, so clients never trigger fetches.
+    def __init__(self, provider: EventProvider, interval_seconds: float = REFRESH_INTERVAL_SECONDS):
+        self.provider = provider
+        self.interval_seconds = interval_seconds
+        self.body = b""
+        self.status = 200
+        self.etag = ""
+        self.version = 0
+        self.changed = asyncio.Condition()
+        self.task: asyncio.Task | None = None
+
+    def start(self):
+        self.task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.interval_seconds)
+
+    async def refresh(self):
+        try:
+            body, status = events_json(await self.provider.get_events()), 200
+        except Exception as exc:
+            body, status = orjson.dumps({"error": str(exc) or "failed to load events"}), 500
+
+        async with self.changed:
+            if self.version and body == self.body and status == self.status:
+                return
+            self.body = body
+            self.status = status
+            self.etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+            self.version += 1
+            self.changed.notify_all()
+
+    async def wait_for_version(self, seen: int) -> int:
+        async with self.changed:
+            await self.changed.wait_for(lambda: self.version != seen)
+            return self.version
 
 
-def exit_process_after_delay(delay_seconds: float = 0.05):
-    def _exit_later():
-        time.sleep(delay_seconds)
-        os._exit(0)
+def open_url(url: str):
+    # Request handlers run off the main thread; AppKit calls belong on it.
+    def _open():
+        NSWorkspace.sharedWorkspace().openURL_(NSURL.URLWithString_(url))
 
-    threading.Thread(target=_exit_later, daemon=True).start()
+    NSOperationQueue.mainQueue().addOperationWithBlock_(_open)
+
+
+def terminate_after_delay(delay_seconds: float = 0.05):
+    # Quit through NSApplication so the window and web view are torn down
+    # normally; the short delay lets the server flush the pending response.
+    def _terminate_later():
+        NSApplication.sharedApplication().performSelector_withObject_afterDelay_(
+            "terminate:", None, delay_seconds
+        )
+
+    NSOperationQueue.mainQueue().addOperationWithBlock_(_terminate_later)
 
 
 HTML_TEMPLATE = """<!doctype html>
@@ -278,6 +637,9 @@ HTML_TEMPLATE = """<!doctype html>
       padding: 10px;
       display: grid;
       gap: 6px;
+      /* Skip layout/paint for cards scrolled out of view. */
+      content-visibility: auto;
+      contain-intrinsic-size: auto 96px;
     }
     .card.has-zoom {
       cursor: pointer;
@@ -344,23 +706,22 @@ HTML_TEMPLATE = """<!doctype html>
   <div class="source">Reading calendar URL from: <code>{{ default_source_file }}</code></div>
   <script>
     const state = { events: [], lastError: null };
+    // Rendered cards by event id, reused across renders while the event is unchanged.
+    const cards = new Map();
 
-    function sameDate(a, b) {
-      return (
-        a.getFullYear() === b.getFullYear() &&
-        a.getMonth() === b.getMonth() &&
-        a.getDate() === b.getDate()
-      );
+    function dayNumber(d) {
+      return d.getFullYear() * 512 + d.getMonth() * 32 + d.getDate();
     }
 
+    // toLocale*String builds a new formatter per call; reuse one of each instead.
+    const timeFormat = new Intl.DateTimeFormat([], { hour: "numeric", minute: "2-digit" });
+    const dateFormat = new Intl.DateTimeFormat([], { weekday: "short", month: "short", day: "numeric" });
+
     function formatTime(d) {
-      return d.toLocaleTimeString([], { hour: "numeric", minute: "2-digit" })
-        .replace(" ", "")
-        .toLowerCase();
+      return timeFormat.format(d).replace(" ", "").toLowerCase();
     }
 
-    function formatDuration(ms) {
-      const totalMins = Math.max(0, Math.floor(ms / 60000));
+    function durationLabel(totalMins) {
       const hours = Math.floor(totalMins / 60);
       const mins = totalMins % 60;
       if (hours > 0 && mins > 0) return `${hours} ${hours === 1 ? "hr" : "hrs"} ${mins} ${mins === 1 ? "min" : "mins"}`;
@@ -368,33 +729,69 @@ HTML_TEMPLATE = """<!doctype html>
       return `${mins} ${mins === 1 ? "min" : "mins"}`;
     }
 
-    function relativeText(now, start, end) {
+    // Relative labels only cover same-day events, so at most a day's worth of minutes.
+    const durationLabels = new Map();
+
+    function formatDuration(ms) {
+      const totalMins = Math.max(0, Math.floor(ms / 60000));
+      let label = durationLabels.get(totalMins);
+      if (label === undefined) {
+        label = durationLabel(totalMins);
+        durationLabels.set(totalMins, label);
+      }
+      return label;
+    }
+
+    function relativeText(now, nowDay, event) {
+      const { _start: start, _end: end } = event;
       if (now >= start && now <= end) return "current";
-      if (!sameDate(now, start)) return "";
+      if (event._startDay !== nowDay) return "";
       if (now < start) return `in ${formatDuration(start - now)}`;
       return `ended ${formatDuration(now - end)} ago`;
     }
 
-    function whenText(now, start, end) {
-      if (sameDate(now, start)) return `${formatTime(start)}-${formatTime(end)}`;
-      const startDate = start.toLocaleDateString([], { weekday: "short", month: "short", day: "numeric" });
-      if (sameDate(start, end)) return `${startDate} ${formatTime(start)}-${formatTime(end)}`;
-      const endDate = end.toLocaleDateString([], { weekday: "short", month: "short", day: "numeric" });
+    function whenText(nowDay, event) {
+      const { _start: start, _end: end } = event;
+      if (event._startDay === nowDay) return `${formatTime(start)}-${formatTime(end)}`;
+      const startDate = dateFormat.format(start);
+      if (event._startDay === event._endDay) return `${startDate} ${formatTime(start)}-${formatTime(end)}`;
+      const endDate = dateFormat.format(end);
       return `${startDate} ${formatTime(start)} - ${endDate} ${formatTime(end)}`;
     }
 
-    function cardFor(event) {
-      const now = new Date();
-      const start = new Date(event.start_iso);
-      const end = new Date(event.end_iso);
-      const rel = relativeText(now, start, end);
-      const timeLine = rel ? `${whenText(now, start, end)} (${rel})` : whenText(now, start, end);
+    function eventKey(event) {
+      return JSON.stringify([event.start_iso, event.end_iso, event.title, event.description, event.zoom_link]);
+    }
 
+    function prepareEvent(event) {
+      // Dates and their day numbers only depend on the event, so work them out once.
+      if (event._start) return;
+      event._start = new Date(event.start_iso);
+      event._end = new Date(event.end_iso);
+      event._startDay = dayNumber(event._start);
+      event._endDay = dayNumber(event._end);
+    }
+
+    function updateCard(entry, now, nowDay) {
+      const { event } = entry;
+      prepareEvent(event);
+      // The date/time part only changes at midnight; the relative part per tick.
+      if (event._whenDay !== nowDay) {
+        event._when = whenText(nowDay, event);
+        event._whenDay = nowDay;
+      }
+      const rel = relativeText(now, nowDay, event);
+      const text = rel ? `${event._when} (${rel})` : event._when;
+      if (entry.text !== text) {
+        entry.text = text;
+        entry.time.textContent = text;
+      }
+      entry.card.classList.toggle("current", rel === "current");
+    }
+
+    function cardFor(event, key) {
       const card = document.createElement("article");
       card.className = "card";
-      if (rel === "current") {
-        card.classList.add("current");
-      }
       if (event.zoom_link) {
         card.classList.add("has-zoom");
         card.addEventListener("click", () => openZoom(event.zoom_link));
@@ -407,7 +804,6 @@ HTML_TEMPLATE = """<!doctype html>
 
       const time = document.createElement("div");
       time.className = "time";
-      time.textContent = timeLine;
       card.appendChild(time);
 
       if (event.description) {
@@ -424,7 +820,7 @@ HTML_TEMPLATE = """<!doctype html>
         card.appendChild(zoom);
       }
 
-      return card;
+      return { event, key, card, time, text: "" };
     }
 
     async function openZoom(url) {
@@ -445,13 +841,13 @@ HTML_TEMPLATE = """<!doctype html>
 
     function render() {
       const root = document.getElementById("events");
-      root.innerHTML = "";
 
       if (state.lastError) {
         const error = document.createElement("div");
         error.className = "error";
         error.textContent = state.lastError;
-        root.appendChild(error);
+        cards.clear();
+        root.replaceChildren(error);
         return;
       }
 
@@ -459,107 +855,177 @@ HTML_TEMPLATE = """<!doctype html>
         const empty = document.createElement("div");
         empty.className = "empty";
         empty.textContent = "No events.";
-        root.appendChild(empty);
+        cards.clear();
+        root.replaceChildren(empty);
         return;
       }
 
+      root.querySelectorAll(":scope > .empty, :scope > .error").forEach((node) => node.remove());
+      const now = new Date();
+      const nowDay = dayNumber(now);
+      const seen = new Set();
+      let previous = null;
       for (const event of state.events) {
-        root.appendChild(cardFor(event));
+        const key = eventKey(event);
+        let entry = cards.get(event.id);
+        if (!entry || entry.key !== key) {
+          entry?.card.remove();
+          entry = cardFor(event, key);
+          cards.set(event.id, entry);
+        }
+        seen.add(event.id);
+        updateCard(entry, now, nowDay);
+
+        const expected = previous ? previous.nextSibling : root.firstChild;
+        if (entry.card !== expected) root.insertBefore(entry.card, expected);
+        previous = entry.card;
       }
-    }
 
-    async function refreshEvents() {
-      try {
-        const resp = await fetch("/api/events", { cache: "no-store" });
-        const payload = await resp.json().catch(() => null);
-        if (!resp.ok) {
-          const message =
-            payload && typeof payload.error === "string"
-              ? payload.error
-              : "Could not load events.";
-          throw new Error(message);
+      for (const [id, entry] of cards) {
+        if (!seen.has(id)) {
+          entry.card.remove();
+          cards.delete(id);
         }
-        state.events = Array.isArray(payload) ? payload : [];
+      }
+    }
+
+    function updateRelativeTimes() {
+      const now = new Date();
+      const nowDay = dayNumber(now);
+      for (const entry of cards.values()) updateCard(entry, now, nowDay);
+    }
+
+    function applyPayload(payload) {
+      if (Array.isArray(payload)) {
+        state.events = payload;
         state.lastError = null;
-      } catch (error) {
+      } else {
         state.events = [];
-        state.lastError = error instanceof Error ? error.message : "Could not load events.";
+        state.lastError =
+          payload && typeof payload.error === "string"
+            ? payload.error
+            : "Could not load events.";
       }
       render();
     }
 
-    refreshEvents();
-    setInterval(refreshEvents, 5 * 60 * 1000);
-    setInterval(render, 30 * 1000);
+    function subscribeEvents() {
+      // The server pushes the current events on connect and again whenever
+      // they change; EventSource reconnects by itself after errors.
+      const source = new EventSource("/api/events/stream");
+      source.onmessage = (message) => {
+        let payload = null;
+        try {
+          payload = JSON.parse(message.data);
+        } catch {
+          // Treated as a load failure below.
+        }
+        applyPayload(payload);
+      };
+      source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED) applyPayload(null);
+      };
+    }
+
+    subscribeEvents();
+    setInterval(updateRelativeTimes, 30 * 1000);
   </script>
 </body>
 </html>
 """
+# The page has no per-request content, so render it once.
+INDEX_HTML = HTML_TEMPLATE.replace(
+    "{{ default_source_file }}", html.escape(DEFAULT_SOURCE_FILE_LABEL)
+).encode("utf-8")
+INDEX_ETAG = hashlib.blake2b(INDEX_HTML, digest_size=16).hexdigest()
 
 
-def create_app(provider: EventProvider) -> Flask:
-    app = Flask(__name__)
+def create_app(provider: EventProvider) -> Quart:
+    app = Quart(__name__)
+    feed = EventFeed(provider)
+
+    @app.before_serving
+    async def start_feed():
+        feed.start()
 
     @app.get("/")
-    def index():
-        return render_template_string(
-            HTML_TEMPLATE,
-            default_source_file=DEFAULT_SOURCE_FILE_LABEL,
+    async def index():
+        response = Response(
+            INDEX_HTML,
+            mimetype="text/html",
+            headers={"Cache-Control": "no-cache"},
         )
+        response.set_etag(INDEX_ETAG)
+        return await response.make_conditional(request)
 
     @app.get("/api/events")
-    def api_events():
-        try:
-            events = [event.as_json() for event in provider.get_events()]
-            return jsonify(events)
-        except Exception as exc:
-            return jsonify({"error": str(exc) or "failed to load events"}), 500
+    async def api_events():
+        await feed.wait_for_version(0)
+        return Response(
+            feed.body,
+            status=feed.status,
+            mimetype="application/json",
+            headers={"ETag": f'"{feed.etag}"'},
+        )
+
+    @app.get("/api/events/stream")
+    async def api_events_stream():
+        async def messages():
+            version = 0
+            while True:
+                version = await feed.wait_for_version(version)
+                yield b"data: " + feed.body + b"\n\n"
+
+        response = await make_response(
+            messages(),
+            {"Content-Type": "text/event-stream", "Cache-Control": "no-cache"},
+        )
+        response.timeout = None
+        return response
 
     @app.post("/open")
-    def open_zoom():
-        payload = request.get_json(silent=True) or {}
+    async def open_zoom():
+        payload = await request.get_json(silent=True) or {}
         requested_url = str(payload.get("url", "")).strip()
         zoom_url = canonicalize_zoom_url(requested_url)
         if not zoom_url:
             return jsonify({"ok": False, "error": "invalid zoom url"}), 400
 
         native_zoom_url = to_zoom_native_url(zoom_url)
-        subprocess.run(["open", native_zoom_url or zoom_url], check=False)
-        exit_process_after_delay()
+        open_url(native_zoom_url or zoom_url)
+        terminate_after_delay()
         return jsonify({"ok": True})
 
     return app
 
 
-def pick_free_port() -> int:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.bind((HOST, 0))
-        return int(sock.getsockname()[1])
+def pick_listen_socket() -> socket.socket:
+    # Listening before the server starts means the widget can connect right
+    # away (requests queue in the backlog) and nothing can take the port.
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((HOST, 0))
+    sock.listen(128)
+    return sock
+
+
+def start_server(app: Quart, sock: socket.socket) -> threading.Thread:
+    config = uvicorn.Config(
+        app,
+        host=HOST,
+        port=sock.getsockname()[1],
+        loop="asyncio",
+        http="httptools",
+        lifespan="on",
+        access_log=False,
+        log_level="warning",
+    )
+    server = uvicorn.Server(config)
 
+    def _serve():
+        asyncio.run(server.serve(sockets=[sock]))
 
-def wait_for_server(port: int, timeout_seconds: float = 5.0) -> bool:
-    deadline = time.time() + timeout_seconds
-    while time.time() < deadline:
-        try:
-            with socket.create_connection((HOST, port), timeout=0.2):
-                return True
-        except OSError:
-            time.sleep(0.05)
-    return False
-
-
-def start_server(app: Flask, port: int) -> threading.Thread:
-    thread = threading.Thread(
-        target=app.run,
-        kwargs={
-            "host": HOST,
-            "port": port,
-            "debug": False,
-            "use_reloader": False,
-            "threaded": True,
-        },
-        daemon=True,
-    )
+    thread = threading.Thread(target=_serve, daemon=True)
     thread.start()
     return thread
 
@@ -627,14 +1093,11 @@ def main(source_override: str | None):
         source, startup_error = load_default_source()
 
     provider = EventProvider(source, startup_error=startup_error)
-    port = pick_free_port()
+    sock = pick_listen_socket()
     app = create_app(provider)
-    start_server(app, port)
-
-    if not wait_for_server(port):
-        raise RuntimeError("failed to start local Flask server")
+    start_server(app, sock)
 
-    widget_url = f"http://{HOST}:{port}/"
+    widget_url = f"http://{HOST}:{sock.getsockname()[1]}/"
     show_web_widget(widget_url)
 
 